@@ -17,6 +17,7 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -352,9 +353,9 @@ def create_analyze_app(video_path: Path, config: ScreenScribeConfig) -> FastAPI:
                 job.last_error = str(exc)
                 job.finished_at = time.time()
 
-    @app.get("/", response_class=HTMLResponse)
-    async def index() -> HTMLResponse:
-        """Serve the analyze UI."""
+    @lru_cache(maxsize=1)
+    def render_index_page() -> bytes:
+        """Build the analyze UI page once; its inputs are fixed for the app."""
         from .html_pro.assets import load_css, load_js_video_player
 
         # Load assets
@@ -1095,7 +1096,12 @@ document.addEventListener('DOMContentLoaded', () => {{
 
 </body>
 </html>"""
-        return HTMLResponse(content=html)
+        return html.encode("utf-8")
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index() -> HTMLResponse:
+        """Serve the analyze UI."""
+        return HTMLResponse(content=render_index_page())
 
     @app.get("/video")
     async def serve_video() -> FileResponse:
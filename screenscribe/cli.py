@@ -1486,13 +1486,9 @@ def config(
 
     if show:
         # Find which config file is being used
-        from .config import CONFIG_PATHS
+        from .config import find_config_path
 
-        config_source = None
-        for cp in CONFIG_PATHS:
-            if cp.exists():
-                config_source = cp
-                break
+        config_source = find_config_path()
 
         if config_source:
             console.print(
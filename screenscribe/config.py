@@ -1,9 +1,15 @@
 """Configuration management with embedded defaults."""
 
 import os
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
+from rich.console import Console
+
+console = Console()
+
 # Default LibraxisAI configuration
 LIBRAXIS_API_BASE = "https://api.libraxis.cloud"
 LIBRAXIS_STT_ENDPOINT = f"{LIBRAXIS_API_BASE}/v1/audio/transcriptions"
@@ -24,6 +30,49 @@ CONFIG_PATHS = [
     # Note: Local .env is NOT auto-loaded - use env vars for overrides
 ]
 
+# Endpoint paths stripped from an api_base value to get the bare base URL
+_API_BASE_SUFFIX_RE = re.compile(r"/v1(?:/responses|/audio/transcriptions|/chat/completions)?\Z")
+
+# Environment variables read by ScreenScribeConfig._load_from_env
+ENV_MAPPING = {
+    # Generic API Key (fallback for all endpoints)
+    "SCREENSCRIBE_API_KEY": "api_key",
+    # Per-provider keys (set appropriate per-endpoint key)
+    "LIBRAXIS_API_KEY": "stt_api_key",  # pragma: allowlist secret
+    "OPENAI_API_KEY": "llm_api_key",  # pragma: allowlist secret
+    # Explicit per-endpoint keys (highest priority)
+    "SCREENSCRIBE_STT_API_KEY": "stt_api_key",  # pragma: allowlist secret
+    "SCREENSCRIBE_LLM_API_KEY": "llm_api_key",  # pragma: allowlist secret
+    "SCREENSCRIBE_VISION_API_KEY": "vision_api_key",  # pragma: allowlist secret
+    # Base URL (auto-derives endpoints if explicit not set)
+    "SCREENSCRIBE_API_BASE": "api_base",
+    "LIBRAXIS_API_BASE": "api_base",
+    # Explicit endpoints (full URLs, no normalization)
+    "SCREENSCRIBE_STT_ENDPOINT": "stt_endpoint",
+    "SCREENSCRIBE_LLM_ENDPOINT": "llm_endpoint",
+    "SCREENSCRIBE_VISION_ENDPOINT": "vision_endpoint",
+    # Models
+    "SCREENSCRIBE_STT_MODEL": "stt_model",
+    "SCREENSCRIBE_LLM_MODEL": "llm_model",
+    "SCREENSCRIBE_VISION_MODEL": "vision_model",
+    # Processing
+    "SCREENSCRIBE_LANGUAGE": "language",
+    "SCREENSCRIBE_SEMANTIC": "use_semantic_analysis",
+    "SCREENSCRIBE_VISION": "use_vision_analysis",
+}
+
+
+def find_config_path() -> Path | None:
+    """Return the config file ScreenScribeConfig.load() reads, if any.
+
+    Stops at the first hit, so lower-priority locations are not probed once
+    a config file is found.
+    """
+    for config_path in CONFIG_PATHS:
+        if config_path.exists():
+            return config_path
+    return None
+
 
 @dataclass
 class ScreenScribeConfig:
@@ -92,11 +141,10 @@ class ScreenScribeConfig:
         """Load config from environment and config files."""
         config = cls()
 
-        # Try config files first
-        for config_path in CONFIG_PATHS:
-            if config_path.exists():
-                config._load_from_file(config_path)
-                break
+        # Config file first
+        config_path = find_config_path()
+        if config_path is not None:
+            config._load_from_file(config_path)
 
         # Environment variables override config files
         config._load_from_env()
@@ -105,112 +153,56 @@ class ScreenScribeConfig:
 
     def _load_from_file(self, path: Path) -> None:
         """Load configuration from .env file."""
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    self._set_from_key(key, value)
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            # Shell-style .env files prefix assignments with "export"
+            key = key.strip().removeprefix("export ").strip()
+            if not self._set_from_key(key, value.strip().strip('"').strip("'")):
+                console.print(f"[yellow]Unknown config key ignored: {key} ({path})[/]")
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        env_mapping = {
-            # Generic API Key (fallback for all endpoints)
-            "SCREENSCRIBE_API_KEY": "api_key",
-            # Per-provider keys (set appropriate per-endpoint key)
-            "LIBRAXIS_API_KEY": "stt_api_key",  # pragma: allowlist secret
-            "OPENAI_API_KEY": "llm_api_key",  # pragma: allowlist secret
-            # Explicit per-endpoint keys (highest priority)
-            "SCREENSCRIBE_STT_API_KEY": "stt_api_key",  # pragma: allowlist secret
-            "SCREENSCRIBE_LLM_API_KEY": "llm_api_key",  # pragma: allowlist secret
-            "SCREENSCRIBE_VISION_API_KEY": "vision_api_key",  # pragma: allowlist secret
-            # Base URL (auto-derives endpoints if explicit not set)
-            "SCREENSCRIBE_API_BASE": "api_base",
-            "LIBRAXIS_API_BASE": "api_base",
-            # Explicit endpoints (full URLs, no normalization)
-            "SCREENSCRIBE_STT_ENDPOINT": "stt_endpoint",
-            "SCREENSCRIBE_LLM_ENDPOINT": "llm_endpoint",
-            "SCREENSCRIBE_VISION_ENDPOINT": "vision_endpoint",
-            # Models
-            "SCREENSCRIBE_STT_MODEL": "stt_model",
-            "SCREENSCRIBE_LLM_MODEL": "llm_model",
-            "SCREENSCRIBE_VISION_MODEL": "vision_model",
-            # Processing
-            "SCREENSCRIBE_LANGUAGE": "language",
-            "SCREENSCRIBE_SEMANTIC": "use_semantic_analysis",
-            "SCREENSCRIBE_VISION": "use_vision_analysis",
-        }
-
-        for env_key, _attr in env_mapping.items():
+        for env_key in ENV_MAPPING:
             value = os.environ.get(env_key)
             if value:
                 self._set_from_key(env_key, value)
 
-    def _set_from_key(self, key: str, value: str) -> None:
-        """Set attribute from key-value pair."""
-        key_lower = key.lower()
-
-        # Per-endpoint API keys (explicit)
-        if "stt_api_key" in key_lower:
-            self.stt_api_key = value
-        elif "llm_api_key" in key_lower:
-            self.llm_api_key = value
-        elif "vision_api_key" in key_lower:
-            self.vision_api_key = value
-        # Provider-specific keys
-        elif "openai_api_key" in key_lower:
-            # OpenAI key → LLM + Vision
-            self.llm_api_key = value
-            self.vision_api_key = value
-        elif "libraxis_api_key" in key_lower:
-            # LibraxisAI key → STT (and fallback)
-            self.stt_api_key = value
-            if not self.api_key:
-                self.api_key = value
-        elif "api_key" in key_lower:
+    def _set_from_key(self, key: str, value: str) -> bool:
+        """Set attribute from key-value pair; return False for unknown keys."""
+        setter = _KEY_SETTERS.get(key.lower())
+        if setter is None:
+            return False
+        setter(self, value)
+        return True
+
+    def _set_openai_api_key(self, value: str) -> None:
+        """OpenAI key → LLM + Vision."""
+        self.llm_api_key = value
+        self.vision_api_key = value
+
+    def _set_libraxis_api_key(self, value: str) -> None:
+        """LibraxisAI key → STT (and fallback)."""
+        self.stt_api_key = value
+        if not self.api_key:
             self.api_key = value
-        # Explicit endpoints (full URLs - use as-is, no normalization)
-        elif "stt_endpoint" in key_lower:
-            self.stt_endpoint = value.rstrip("/")
-        elif "llm_endpoint" in key_lower:
-            self.llm_endpoint = value.rstrip("/")
-        elif "vision_endpoint" in key_lower:
-            self.vision_endpoint = value.rstrip("/")
-        # Base URL (derives endpoints if explicit not set)
-        elif "api_base" in key_lower:
-            # Normalize api_base - remove trailing paths
-            normalized = value.rstrip("/")
-            for suffix in [
-                "/v1/responses",
-                "/v1/audio/transcriptions",
-                "/v1/chat/completions",
-                "/v1",
-            ]:
-                if normalized.endswith(suffix):
-                    normalized = normalized[: -len(suffix)]
-                    break
-            self.api_base = normalized
-            # Only update endpoints if still at defaults (not explicitly set)
-            if self.stt_endpoint == LIBRAXIS_STT_ENDPOINT:
-                self.stt_endpoint = f"{normalized}/v1/audio/transcriptions"
-            if self.llm_endpoint == LIBRAXIS_LLM_ENDPOINT:
-                self.llm_endpoint = f"{normalized}/v1/responses"
-            if self.vision_endpoint == LIBRAXIS_VISION_ENDPOINT:
-                self.vision_endpoint = f"{normalized}/v1/responses"
-        elif "stt_model" in key_lower:
-            self.stt_model = value
-        elif "llm_model" in key_lower:
-            self.llm_model = value
-        elif "vision_model" in key_lower:
-            self.vision_model = value
-        elif "language" in key_lower:
-            self.language = value
-        elif "semantic" in key_lower:
-            self.use_semantic_analysis = value.lower() in ("true", "1", "yes")
-        elif "vision" in key_lower and "model" not in key_lower and "endpoint" not in key_lower:
-            self.use_vision_analysis = value.lower() in ("true", "1", "yes")
+
+    def _set_api_base(self, value: str) -> None:
+        """Set base URL and derive endpoints that were not explicitly set."""
+        # Normalize api_base - remove trailing paths
+        normalized = _API_BASE_SUFFIX_RE.sub("", value.rstrip("/"), count=1)
+        self.api_base = normalized
+        # Only update endpoints if still at defaults (not explicitly set)
+        if self.stt_endpoint == LIBRAXIS_STT_ENDPOINT:
+            self.stt_endpoint = f"{normalized}/v1/audio/transcriptions"
+        if self.llm_endpoint == LIBRAXIS_LLM_ENDPOINT:
+            self.llm_endpoint = f"{normalized}/v1/responses"
+        if self.vision_endpoint == LIBRAXIS_VISION_ENDPOINT:
+            self.vision_endpoint = f"{normalized}/v1/responses"
 
     def save_default_config(self) -> Path:
         """Save default config to user's config directory."""
@@ -266,3 +258,53 @@ SCREENSCRIBE_VISION={str(self.use_vision_analysis).lower()}
             f.write(content)
 
         return config_path
+
+
+def _attr_setter(
+    attr: str, convert: Callable[[str], object] = str
+) -> Callable[[ScreenScribeConfig, str], None]:
+    """Build a setter that stores a converted value on a config attribute."""
+
+    def set_value(config: ScreenScribeConfig, value: str) -> None:
+        setattr(config, attr, convert(value))
+
+    return set_value
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean flag value from config."""
+    return value.lower() in ("true", "1", "yes")
+
+
+def _strip_trailing_slash(value: str) -> str:
+    """Strip trailing slashes from an explicit endpoint URL."""
+    return value.rstrip("/")
+
+
+# Lowercased config key → setter (keys match ENV_MAPPING)
+_KEY_SETTERS: dict[str, Callable[[ScreenScribeConfig, str], None]] = {
+    # Generic API Key (fallback for all endpoints)
+    "screenscribe_api_key": _attr_setter("api_key"),
+    # Provider-specific keys
+    "libraxis_api_key": ScreenScribeConfig._set_libraxis_api_key,
+    "openai_api_key": ScreenScribeConfig._set_openai_api_key,
+    # Per-endpoint API keys (explicit)
+    "screenscribe_stt_api_key": _attr_setter("stt_api_key"),
+    "screenscribe_llm_api_key": _attr_setter("llm_api_key"),
+    "screenscribe_vision_api_key": _attr_setter("vision_api_key"),
+    # Base URL (derives endpoints if explicit not set)
+    "screenscribe_api_base": ScreenScribeConfig._set_api_base,
+    "libraxis_api_base": ScreenScribeConfig._set_api_base,
+    # Explicit endpoints (full URLs - use as-is, no normalization)
+    "screenscribe_stt_endpoint": _attr_setter("stt_endpoint", _strip_trailing_slash),
+    "screenscribe_llm_endpoint": _attr_setter("llm_endpoint", _strip_trailing_slash),
+    "screenscribe_vision_endpoint": _attr_setter("vision_endpoint", _strip_trailing_slash),
+    # Models
+    "screenscribe_stt_model": _attr_setter("stt_model"),
+    "screenscribe_llm_model": _attr_setter("llm_model"),
+    "screenscribe_vision_model": _attr_setter("vision_model"),
+    # Processing
+    "screenscribe_language": _attr_setter("language"),
+    "screenscribe_semantic": _attr_setter("use_semantic_analysis", _parse_bool),
+    "screenscribe_vision": _attr_setter("use_vision_analysis", _parse_bool),
+}
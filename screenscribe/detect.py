@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,6 +21,9 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Maximum gap (seconds) between detections of one category that get merged
+MERGE_MAX_GAP = 5.0
+
 # Global keywords config (lazy loaded)
 _keywords_config: KeywordsConfig | None = None
 
@@ -35,14 +42,111 @@ def reset_keywords_config() -> None:
     _keywords_config = None
 
 
-# Load defaults for module-level access (backward compatibility)
-_default_config = KeywordsConfig.load()
-BUG_KEYWORDS: list[str] = _default_config.bug
-CHANGE_KEYWORDS: list[str] = _default_config.change
-UI_KEYWORDS: list[str] = _default_config.ui
+# Group references (backreferences, conditionals) point at the wrong group once
+# patterns are joined into one regex, because joining renumbers the groups
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@lru_cache(maxsize=16)
+def _compile_keywords(
+    patterns: tuple[str, ...],
+) -> tuple[re.Pattern[str] | None, tuple[tuple[str, re.Pattern[str]], ...]]:
+    """
+    Compile a category's keyword patterns once.
+
+    Returns a union regex of all patterns (one scan tells whether any pattern
+    matches) plus each pattern compiled individually, paired with its source
+    string, to report which keywords were found. The union is None when there
+    are no patterns or they cannot be combined.
+    """
+    compiled = tuple((p, re.compile(p)) for p in patterns)
+    if not patterns or any(_GROUP_REFERENCE_RE.search(p) for p in patterns):
+        return None, compiled
+    try:
+        union = re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        # e.g. inline global flags, which are only valid at the start of a regex
+        return None, compiled
+    return union, compiled
+
+
+def _match_keywords(patterns: Sequence[str], text_lower: str) -> list[str]:
+    """Return the patterns from a keyword category that match the text."""
+    union, compiled = _compile_keywords(tuple(patterns))
+    if union is not None and not union.search(text_lower):
+        return []
+    return [pattern for pattern, regex in compiled if regex.search(text_lower)]
+
+
+# Constructs whose result depends on where a segment's string ends; the joined
+# transcript scan cannot reproduce them (nor group references, see above), so
+# such keyword sets scan per segment. Atomic groups and possessive quantifiers
+# can run on into the next segment and then refuse to backtrack.
+_BOUNDARY_SENSITIVE = ("\\A", "\\Z", "(?=", "(?!", "(?<", "(?>", "*+", "++", "?+", "}+")
+
+
+@lru_cache(maxsize=16)
+def _compile_transcript_scanner(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile a multiline union of patterns for scanning a joined transcript."""
+    if not patterns or any(
+        _GROUP_REFERENCE_RE.search(p) or any(token in p for token in _BOUNDARY_SENSITIVE)
+        for p in patterns
+    ):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.MULTILINE)
+    except re.error:
+        return None
 
 
-@dataclass
+def _candidate_segments(patterns: tuple[str, ...], texts_lower: list[str]) -> list[int]:
+    """
+    Return indices of segments where at least one keyword pattern matches.
+
+    Segment texts are joined with newlines and scanned in one pass; each match
+    is mapped back to its segment by offset, and scanning resumes at the start
+    of the next segment so a match spilling over a boundary cannot hide one.
+    """
+    if not texts_lower:
+        return []
+    scanner = _compile_transcript_scanner(patterns)
+    if scanner is None:
+        return [i for i, text in enumerate(texts_lower) if _match_keywords(patterns, text)]
+
+    starts = []
+    offset = 0
+    for text in texts_lower:
+        starts.append(offset)
+        offset += len(text) + 1
+    joined = "\n".join(texts_lower)
+
+    candidates = []
+    pos = 0
+    while (match := scanner.search(joined, pos)) is not None:
+        idx = bisect_right(starts, match.start()) - 1
+        candidates.append(idx)
+        if idx + 1 >= len(starts):
+            break
+        pos = starts[idx + 1]
+    return candidates
+
+
+# Module-level keyword lists (backward compatibility), resolved on first access
+_LEGACY_KEYWORD_ATTRS = {
+    "BUG_KEYWORDS": "bug",
+    "CHANGE_KEYWORDS": "change",
+    "UI_KEYWORDS": "ui",
+}
+
+
+def __getattr__(name: str) -> list[str]:
+    """Load BUG_KEYWORDS / CHANGE_KEYWORDS / UI_KEYWORDS lazily."""
+    if name in _LEGACY_KEYWORD_ATTRS:
+        return get_keywords_config().get_keywords(_LEGACY_KEYWORD_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(slots=True)
 class Detection:
     """A detected issue or change request."""
 
@@ -68,7 +172,8 @@ def detect_issues(
     Returns:
         List of detections with category and context
     """
-    detections = []
+    merged: list[Detection] = []
+    current: Detection | None = None
     segments = transcription.segments
 
     # Load keywords (custom or default)
@@ -76,53 +181,66 @@ def detect_issues(
     bug_keywords = keywords.bug
     change_keywords = keywords.change
     ui_keywords = keywords.ui
+    texts_lower = [segment.text.lower() for segment in segments]
+
+    # Context windows are slices of the space-joined transcript
+    transcript_text = " ".join(segment.text for segment in segments)
+    text_starts = list(accumulate((len(segment.text) + 1 for segment in segments), initial=0))
 
     console.print("[blue]Analyzing transcript for issues...[/]")
     console.print(f"[dim]{keywords.summary()}[/]")
 
-    for i, segment in enumerate(segments):
-        text_lower = segment.text.lower()
+    # Most segments match nothing: one pass over the transcript finds the rest
+    all_keywords = tuple(bug_keywords + change_keywords + ui_keywords)
+    for i in _candidate_segments(all_keywords, texts_lower):
+        segment = segments[i]
+        text_lower = texts_lower[i]
         found_keywords = []
         category = None
 
         # Check for bugs
-        for pattern in bug_keywords:
-            if re.search(pattern, text_lower):
-                found_keywords.append(pattern)
-                category = "bug"
+        bug_found = _match_keywords(bug_keywords, text_lower)
+        if bug_found:
+            found_keywords.extend(bug_found)
+            category = "bug"
 
         # Check for change requests
-        for pattern in change_keywords:
-            if re.search(pattern, text_lower):
-                found_keywords.append(pattern)
-                if category is None:
-                    category = "change"
+        change_found = _match_keywords(change_keywords, text_lower)
+        if change_found:
+            found_keywords.extend(change_found)
+            if category is None:
+                category = "change"
 
         # Check for UI-related
-        for pattern in ui_keywords:
-            if re.search(pattern, text_lower):
-                found_keywords.append(pattern)
-                if category is None:
-                    category = "ui"
+        ui_found = _match_keywords(ui_keywords, text_lower)
+        if ui_found:
+            found_keywords.extend(ui_found)
+            if category is None:
+                category = "ui"
 
         if category and found_keywords:
             # Build context from surrounding segments
             start_idx = max(0, i - context_window)
             end_idx = min(len(segments), i + context_window + 1)
-            context_segments = segments[start_idx:end_idx]
-            context = " ".join(s.text for s in context_segments)
-
-            detections.append(
-                Detection(
-                    segment=segment,
-                    category=category,
-                    keywords_found=list(set(found_keywords)),
-                    context=context,
-                )
+            context = transcript_text[text_starts[start_idx] : text_starts[end_idx] - 1]
+
+            detection = Detection(
+                segment=segment,
+                category=category,
+                keywords_found=list(dict.fromkeys(found_keywords)),
+                context=context,
             )
 
-    # Merge consecutive detections
-    merged = merge_consecutive_detections(detections)
+            # Merge consecutive detections as they are found
+            if current is not None and _can_merge(current, detection, MERGE_MAX_GAP):
+                current = _merge_detections(current, detection)
+            else:
+                if current is not None:
+                    merged.append(current)
+                current = detection
+
+    if current is not None:
+        merged.append(current)
 
     console.print(
         f"[green]Found {len(merged)} issues:[/] "
@@ -134,8 +252,29 @@ def detect_issues(
     return merged
 
 
+def _can_merge(current: Detection, detection: Detection, max_gap: float) -> bool:
+    """Whether a detection continues the current one (same category, small gap)."""
+    gap = detection.segment.start - current.segment.end
+    return gap <= max_gap and detection.category == current.category
+
+
+def _merge_detections(current: Detection, detection: Detection) -> Detection:
+    """Merge: extend end time, combine keywords and context."""
+    return Detection(
+        segment=Segment(
+            id=current.segment.id,
+            start=current.segment.start,
+            end=detection.segment.end,
+            text=f"{current.segment.text} {detection.segment.text}",
+        ),
+        category=current.category,
+        keywords_found=list(dict.fromkeys(current.keywords_found + detection.keywords_found)),
+        context=f"{current.context} ... {detection.context}",
+    )
+
+
 def merge_consecutive_detections(
-    detections: list[Detection], max_gap: float = 5.0
+    detections: list[Detection], max_gap: float = MERGE_MAX_GAP
 ) -> list[Detection]:
     """
     Merge consecutive detections that are close in time.
@@ -154,21 +293,8 @@ def merge_consecutive_detections(
     current = detections[0]
 
     for detection in detections[1:]:
-        gap = detection.segment.start - current.segment.end
-
-        if gap <= max_gap and detection.category == current.category:
-            # Merge: extend end time, combine keywords and context
-            current = Detection(
-                segment=Segment(
-                    id=current.segment.id,
-                    start=current.segment.start,
-                    end=detection.segment.end,
-                    text=f"{current.segment.text} {detection.segment.text}",
-                ),
-                category=current.category,
-                keywords_found=list(set(current.keywords_found + detection.keywords_found)),
-                context=f"{current.context} ... {detection.context}",
-            )
+        if _can_merge(current, detection, max_gap):
+            current = _merge_detections(current, detection)
         else:
             merged.append(current)
             current = detection
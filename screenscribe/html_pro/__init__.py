@@ -3,6 +3,6 @@
 This package provides the modular HTML Pro report renderer for ScreenScribe.
 """
 
-from .renderer import render_html_report_pro
+from .renderer import render_html_report_pro, render_html_report_pro_parts
 
-__all__ = ["render_html_report_pro"]
+__all__ = ["render_html_report_pro", "render_html_report_pro_parts"]
@@ -26,9 +26,10 @@ def load_asset(filename: str) -> str:
         FileNotFoundError: If asset file doesn't exist
     """
     asset_path = ASSETS_DIR / filename
-    if not asset_path.exists():
-        raise FileNotFoundError(f"Asset not found: {asset_path}")
-    return asset_path.read_text(encoding="utf-8")
+    try:
+        return asset_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Asset not found: {asset_path}") from None
 
 
 def load_css() -> str:
@@ -14,6 +14,16 @@ if TYPE_CHECKING:
     from ..transcribe import Segment
 
 
+def _escape_for_script(json_text: str) -> str:
+    """Escape "<" so embedded JSON cannot close or re-open its <script> element.
+
+    Escaping only "</" is not enough: "<!--<script>" in the data switches the
+    HTML parser to the double-escaped state, where the real closing tag no
+    longer ends the element.
+    """
+    return json_text.replace("<", "\\u003c")
+
+
 def generate_report_id(video_name: str, timestamp: str) -> str:
     """Generate a unique report ID based on video name and timestamp.
 
@@ -37,7 +47,8 @@ def prepare_findings_json(findings: list[dict[str, Any]]) -> str:
     Returns:
         JSON string (escaped for HTML embedding)
     """
-    return json.dumps(findings, ensure_ascii=False, indent=2)
+    # No indent: indented output bypasses json's C encoder
+    return _escape_for_script(json.dumps(findings, ensure_ascii=False))
 
 
 def prepare_segments_json(segments: list[Segment] | None) -> str:
@@ -47,20 +58,21 @@ def prepare_segments_json(segments: list[Segment] | None) -> str:
         segments: List of transcript Segment objects (or None)
 
     Returns:
-        JSON array of segment objects with start, end, text
+        JSON array of segment objects with id, start, end, text
     """
     if not segments:
         return "[]"
 
     segment_data = [
         {
+            "id": seg.id,
             "start": seg.start,
             "end": seg.end,
             "text": seg.text,
         }
         for seg in segments
     ]
-    return json.dumps(segment_data, ensure_ascii=False)
+    return _escape_for_script(json.dumps(segment_data, ensure_ascii=False))
 
 
 def format_timestamp(timestamp: datetime | None = None) -> str:
@@ -7,28 +7,52 @@ from __future__ import annotations
 
 import base64
 import html
-import json
+import math
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 from typing import TYPE_CHECKING, Any
 
 from .assets import load_css, load_html_template, load_js_review_app, load_js_video_player
-from .data import generate_report_id
+from .data import generate_report_id, prepare_findings_json, prepare_segments_json
 
 if TYPE_CHECKING:
     from ..transcribe import Segment
 
 
+_SEVERITIES = ("critical", "high", "medium", "low")
+
+# Only videos smaller than this are embedded as base64
+_VIDEO_EMBED_MAX_BYTES = 50 * 1024 * 1024
+
+# Chunk size for base64-encoding embedded video; a multiple of 3 so chunks
+# encode without padding and concatenate into one valid base64 string
+_VIDEO_EMBED_CHUNK_SIZE = 3 * 1024 * 1024
+
+
+def _video_data_url(video_path: Path, media_type: str) -> list[str]:
+    """Encode a video file as a base64 data URL, returned as a list of chunks.
+
+    The chunks are never joined here: streaming them out separately keeps
+    peak memory at about one copy of the encoded video.
+    """
+    parts = [f"data:{media_type};base64,"]
+    with open(video_path, "rb") as vf:
+        while chunk := vf.read(_VIDEO_EMBED_CHUNK_SIZE):
+            parts.append(base64.b64encode(chunk).decode("ascii"))
+    return parts
+
+
 def _render_stats(findings: list[dict[str, Any]]) -> str:
     """Render severity statistics cards."""
-    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-
-    for f in findings:
-        unified = f.get("unified_analysis", {})
-        if unified.get("is_issue", True):
-            severity = unified.get("severity", "medium")
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+    counts = Counter(
+        unified.get("severity", "medium")
+        for unified in (f.get("unified_analysis", {}) for f in findings)
+        if unified.get("is_issue", True)
+    )
+    severity_counts = {severity: counts[severity] for severity in _SEVERITIES}
 
     total = sum(severity_counts.values())
 
@@ -78,17 +102,36 @@ def _render_errors(errors: list[dict[str, str]]) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=32)
+def _category_label(category: str) -> str:
+    """Escaped, upper-cased finding category (a handful of distinct values per report)."""
+    return html.escape(category.upper())
+
+
+def _timestamp_seconds(value: Any) -> float:
+    """Coerce a finding timestamp for the onclick seek handler (0 if not a finite number)."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    # nan/inf would render as bare identifiers in the JS handler
+    return seconds if math.isfinite(seconds) else 0.0
+
+
 def _render_finding(f: dict[str, Any], index: int) -> str:
     """Render a single finding as an article element."""
     finding_id = f.get("id", index)
     category = f.get("category", "unknown")
-    timestamp = f.get("timestamp_formatted", "00:00")
-    timestamp_seconds = f.get("timestamp", 0)
+    timestamp = html.escape(f.get("timestamp_formatted", "00:00"))
+    timestamp_seconds = _timestamp_seconds(f.get("timestamp", 0))
     text = html.escape(f.get("text", ""))
     screenshot = f.get("screenshot", "")
 
     unified = f.get("unified_analysis", {})
     severity = unified.get("severity", "medium")
+    if severity not in _SEVERITIES:
+        # Free-form model output: escape once for both the class and the badge
+        severity = html.escape(severity)
     summary = html.escape(unified.get("summary", ""))
     suggested_fix = html.escape(unified.get("suggested_fix", ""))
     affected_components = unified.get("affected_components", [])
@@ -97,15 +140,16 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
 
     severity_class = f"severity-{severity}" if severity else "severity-none"
 
-    details_html = ""
+    details_parts: list[str] = []
     if affected_components:
-        components = ", ".join(html.escape(c) for c in affected_components)
-        details_html += f"<dt>Dotknięte komponenty</dt><dd>{components}</dd>"
+        components = ", ".join([html.escape(c) for c in affected_components])
+        details_parts.append(f"<dt>Dotknięte komponenty</dt><dd>{components}</dd>")
     if suggested_fix:
-        details_html += f"<dt>Sugerowana poprawka</dt><dd>{suggested_fix}</dd>"
+        details_parts.append(f"<dt>Sugerowana poprawka</dt><dd>{suggested_fix}</dd>")
     if issues_detected:
-        issues = "; ".join(html.escape(i) for i in issues_detected)
-        details_html += f"<dt>Wizualne problemy</dt><dd>{issues}</dd>"
+        issues = "; ".join([html.escape(i) for i in issues_detected])
+        details_parts.append(f"<dt>Wizualne problemy</dt><dd>{issues}</dd>")
+    details_html = "".join(details_parts)
 
     screenshot_html = ""
     if screenshot:
@@ -121,7 +165,19 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
         </div>
         """
 
-    action_items_display = ", ".join(action_items) if action_items else ""
+    summary_html = ""
+    if summary:
+        summary_html = (
+            f'<div class="finding-summary"><strong>Podsumowanie:</strong> {summary}</div>'
+        )
+
+    suggestions_html = ""
+    if action_items:
+        suggestions = html.escape(", ".join(action_items))
+        suggestions_html = (
+            '<div class="ai-suggestions">'
+            f'<strong data-i18n="aiSuggestions">Sugestie AI:</strong> {suggestions}</div>'
+        )
 
     return f"""
     <article class="finding" data-finding-id="{finding_id}" data-confirmed="">
@@ -129,17 +185,17 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
             <div>
                 <span class="finding-title">
                     <span class="index">#{index}</span>
-                    {html.escape(category.upper())}
+                    {_category_label(category)}
                 </span>
                 <span class="finding-meta" onclick="seekToTimestamp({timestamp_seconds})"
-                      title="Kliknij aby przejsc do tego momentu">@ {html.escape(timestamp)}</span>
+                      title="Kliknij aby przejsc do tego momentu">@ {timestamp}</span>
             </div>
-            <span class="severity-badge {severity_class}">{html.escape(severity)}</span>
+            <span class="severity-badge {severity_class}">{severity}</span>
         </div>
 
         <div class="finding-content">
             <div class="finding-transcript">{text}</div>
-            {f'<div class="finding-summary"><strong>Podsumowanie:</strong> {summary}</div>' if summary else ""}
+            {summary_html}
             <dl class="finding-details">
                 {details_html}
             </dl>
@@ -175,7 +231,7 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
             </div>
             <div class="review-field notes">
                 <label data-i18n="notes">Notatki / Akcje</label>
-                {f'<div class="ai-suggestions"><strong data-i18n="aiSuggestions">Sugestie AI:</strong> {html.escape(action_items_display)}</div>' if action_items_display else ''}
+                {suggestions_html}
                 <div class="notes-toolbar">
                     <button type="button"
                             class="notes-mic-btn"
@@ -193,6 +249,12 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
     """
 
 
+@lru_cache(maxsize=1)
+def _split_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split the report template into (literal, field name) pairs, once per template."""
+    return tuple((literal, field_name) for literal, field_name, _, _ in Formatter().parse(template))
+
+
 def render_html_report_pro(
     video_name: str,
     video_path: str | None,
@@ -205,6 +267,40 @@ def render_html_report_pro(
 ) -> str:
     """Render complete HTML Pro report with video player and synchronized subtitles.
 
+    Same arguments as render_html_report_pro_parts(), joined into one string.
+
+    Returns:
+        Complete HTML document as string
+    """
+    return "".join(
+        render_html_report_pro_parts(
+            video_name=video_name,
+            video_path=video_path,
+            generated_at=generated_at,
+            executive_summary=executive_summary,
+            findings=findings,
+            segments=segments,
+            errors=errors,
+            embed_video=embed_video,
+        )
+    )
+
+
+def render_html_report_pro_parts(
+    video_name: str,
+    video_path: str | None,
+    generated_at: str,
+    executive_summary: str,
+    findings: list[dict[str, Any]],
+    segments: list[Segment] | None = None,
+    errors: list[dict[str, str]] | None = None,
+    embed_video: bool = False,
+) -> list[str]:
+    """Render the HTML Pro report as a list of string pieces, in document order.
+
+    Writing the pieces out one by one (e.g. with ``writelines``) avoids building
+    the whole document, which can hold a base64-embedded video, as one string.
+
     Args:
         video_name: Name of the source video file
         video_path: Path to the video file (for embedding or reference)
@@ -216,7 +312,7 @@ def render_html_report_pro(
         embed_video: Whether to embed video as base64 (for smaller files)
 
     Returns:
-        Complete HTML document as string
+        Template literals interleaved with the rendered placeholder values
     """
     errors = errors or []
     segments = segments or []
@@ -224,22 +320,25 @@ def render_html_report_pro(
     # Generate unique report ID
     report_id = generate_report_id(video_name, generated_at)
 
-    # Format timestamp
+    # Format timestamp (fromisoformat accepts a "Z" suffix since Python 3.11)
     try:
-        dt = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(generated_at)
         display_time = dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, AttributeError):
+    except (ValueError, TypeError):
         display_time = generated_at
 
     # Video source handling
     video_src = ""
+    video_data_url: list[str] = []
     if video_path:
         video_path_obj = Path(video_path)
-        if embed_video and video_path_obj.exists():
-            size_mb = video_path_obj.stat().st_size / (1024 * 1024)
-            if size_mb < 50:  # Only embed if < 50MB
-                with open(video_path_obj, "rb") as vf:
-                    video_b64 = base64.b64encode(vf.read()).decode("ascii")
+        # One stat answers both "is it a local file" and "is it small enough to embed"
+        try:
+            video_size = video_path_obj.stat().st_size
+        except OSError:
+            video_src = video_path
+        else:
+            if embed_video and video_size < _VIDEO_EMBED_MAX_BYTES:
                 media_type = {
                     ".mp4": "video/mp4",
                     ".m4v": "video/mp4",
@@ -247,18 +346,11 @@ def render_html_report_pro(
                     ".webm": "video/webm",
                     ".ogv": "video/ogg",
                 }.get(video_path_obj.suffix.lower(), "video/mp4")
-                video_src = f"data:{media_type};base64,{video_b64}"
+                video_data_url = _video_data_url(video_path_obj, media_type)
             else:
                 video_src = (
                     video_path_obj.name if video_path_obj.is_absolute() else str(video_path_obj)
                 )
-        else:
-            if video_path_obj.exists():
-                video_src = (
-                    video_path_obj.name if video_path_obj.is_absolute() else str(video_path_obj)
-                )
-            else:
-                video_src = video_path
 
     # Generate VTT data URL for subtitles
     vtt_data_url = ""
@@ -268,16 +360,13 @@ def render_html_report_pro(
         vtt_data_url = generate_vtt_data_url(segments)
 
     # Segments as JSON for JavaScript
-    segments_json = json.dumps(
-        [{"id": s.id, "start": s.start, "end": s.end, "text": s.text} for s in segments],
-        ensure_ascii=False,
-    )
+    segments_json = prepare_segments_json(segments)
 
     # Build findings HTML
-    findings_html = "\n".join(_render_finding(f, i + 1) for i, f in enumerate(findings))
+    findings_html = "\n".join([_render_finding(f, i) for i, f in enumerate(findings, 1)])
 
     # Embed findings as JSON for export
-    findings_json = json.dumps(findings, ensure_ascii=False)
+    findings_json = prepare_findings_json(findings)
 
     # Load assets
     css_content = load_css()
@@ -285,8 +374,14 @@ def render_html_report_pro(
     js_review_app = load_js_review_app()
     template = load_html_template()
 
-    # Build video source attribute
-    video_src_attr = f'src="{html.escape(video_src)}"' if video_src else ""
+    # Build video source attribute pieces; an embedded video stays in its
+    # base64 chunks, whose characters need no HTML escaping
+    if video_data_url:
+        video_src_attr = ['src="', *video_data_url, '"']
+    elif video_src:
+        video_src_attr = [f'src="{html.escape(video_src)}"']
+    else:
+        video_src_attr = []
 
     # Build VTT track element
     vtt_track = (
@@ -303,21 +398,28 @@ def render_html_report_pro(
             '<p class="text-muted" data-i18n="noSummary">Brak podsumowania AI</p>'
         )
 
-    # Render template with all placeholders
-    return template.format(
-        video_name_escaped=html.escape(video_name),
-        report_id=report_id,
-        findings_count=len(findings),
-        display_time_escaped=html.escape(display_time),
-        video_src_attr=video_src_attr,
-        vtt_track=vtt_track,
-        errors_html=_render_errors(errors),
-        executive_summary_html=executive_summary_html,
-        findings_html=findings_html,
-        stats_html=_render_stats(findings),
-        findings_json=findings_json,
-        segments_json=segments_json,
-        css_content=css_content,
-        js_video_player=js_video_player,
-        js_review_app=js_review_app,
-    )
+    # Fill template placeholders
+    fields = {
+        "video_name_escaped": html.escape(video_name),
+        "report_id": report_id,
+        "findings_count": str(len(findings)),
+        "display_time_escaped": html.escape(display_time),
+        "vtt_track": vtt_track,
+        "errors_html": _render_errors(errors),
+        "executive_summary_html": executive_summary_html,
+        "findings_html": findings_html,
+        "stats_html": _render_stats(findings),
+        "findings_json": findings_json,
+        "segments_json": segments_json,
+        "css_content": css_content,
+        "js_video_player": js_video_player,
+        "js_review_app": js_review_app,
+    }
+    parts: list[str] = []
+    for literal, field_name in _split_template(template):
+        parts.append(literal)
+        if field_name == "video_src_attr":
+            parts.extend(video_src_attr)
+        elif field_name is not None:
+            parts.append(fields[field_name])
+    return parts
@@ -12,10 +12,12 @@ from __future__ import annotations
 
 import hashlib
 import html
-import json
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
+from .html_pro.data import prepare_findings_json
+
 CSS_STYLES = """
 :root {
     --color-critical: #dc2626;
@@ -420,8 +422,14 @@ function saveDraft() {
 }
 
 function restoreUIFromState() {
+    // Index articles once instead of querying the whole DOM per saved finding
+    const articles = new Map();
+    document.querySelectorAll('.finding').forEach(article => {
+        articles.set(article.dataset.findingId, article);
+    });
+
     Object.entries(reportState.findings).forEach(([findingId, state]) => {
-        const article = document.querySelector(`[data-finding-id="${findingId}"]`);
+        const article = articles.get(findingId);
         if (!article) return;
 
         if (state.confirmed !== null) {
@@ -523,6 +531,12 @@ document.addEventListener('DOMContentLoaded', initState);
 """
 
 
+# CSS classes for the known severity levels, which need no escaping
+_SEVERITY_CLASSES = {
+    severity: f"severity-{severity}" for severity in ("critical", "high", "medium", "low")
+}
+
+
 def _render_stats(findings: list[dict[str, Any]]) -> str:
     """Render severity statistics cards.
 
@@ -532,14 +546,12 @@ def _render_stats(findings: list[dict[str, Any]]) -> str:
     Returns:
         HTML string for stats section
     """
-    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-
-    for f in findings:
-        unified = f.get("unified_analysis", {})
-        if unified.get("is_issue", True):
-            severity = unified.get("severity", "medium")
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+    counts = Counter(
+        unified.get("severity", "medium")
+        for unified in (f.get("unified_analysis", {}) for f in findings)
+        if unified.get("is_issue", True)
+    )
+    severity_counts = {severity: counts[severity] for severity in _SEVERITY_CLASSES}
 
     total = sum(severity_counts.values())
 
@@ -648,8 +660,10 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
         HTML string for the finding article
     """
     finding_id = f.get("id", index)
+    if not isinstance(finding_id, int):
+        finding_id = html.escape(str(finding_id))
     category = f.get("category", "unknown")
-    timestamp = f.get("timestamp_formatted", "00:00")
+    timestamp = html.escape(f.get("timestamp_formatted", "00:00"))
     text = html.escape(f.get("text", ""))
     screenshot = f.get("screenshot", "")
 
@@ -661,18 +675,27 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
     issues_detected = unified.get("issues_detected", [])
     action_items = unified.get("action_items", [])
 
-    severity_class = f"severity-{severity}" if severity else "severity-none"
+    severity_class = _SEVERITY_CLASSES.get(severity)
+    if severity_class is None:
+        # Free-form model output: escape once for both the class and the badge
+        severity = html.escape(severity)
+        severity_class = f"severity-{severity}" if severity else "severity-none"
 
     # Build details section
-    details_html = ""
+    details_parts: list[str] = []
     if affected_components:
-        components = ", ".join(html.escape(c) for c in affected_components)
-        details_html += f"<dt>Affected Components</dt><dd>{components}</dd>"
+        components = ", ".join([html.escape(c) for c in affected_components])
+        details_parts.append(f"<dt>Affected Components</dt><dd>{components}</dd>")
     if suggested_fix:
-        details_html += f"<dt>Suggested Fix</dt><dd>{suggested_fix}</dd>"
+        details_parts.append(f"<dt>Suggested Fix</dt><dd>{suggested_fix}</dd>")
     if issues_detected:
-        issues = "; ".join(html.escape(i) for i in issues_detected)
-        details_html += f"<dt>Visual Issues</dt><dd>{issues}</dd>"
+        issues = "; ".join([html.escape(i) for i in issues_detected])
+        details_parts.append(f"<dt>Visual Issues</dt><dd>{issues}</dd>")
+    details_html = "".join(details_parts)
+
+    summary_html = ""
+    if summary:
+        summary_html = f'<div class="finding-summary"><strong>Summary:</strong> {summary}</div>'
 
     # Screenshot thumbnail
     screenshot_html = ""
@@ -693,14 +716,14 @@ def _render_finding(f: dict[str, Any], index: int) -> str:
         <div class="finding-header">
             <div>
                 <span class="finding-title">#{index} {html.escape(category.upper())}</span>
-                <span class="finding-meta">@ {html.escape(timestamp)}</span>
+                <span class="finding-meta">@ {timestamp}</span>
             </div>
-            <span class="severity-badge {severity_class}">{html.escape(severity)}</span>
+            <span class="severity-badge {severity_class}">{severity}</span>
         </div>
 
         <div class="finding-content">
             <div class="finding-transcript">{text}</div>
-            {f'<div class="finding-summary"><strong>Summary:</strong> {summary}</div>' if summary else ""}
+            {summary_html}
             <dl class="finding-details">
                 {details_html}
             </dl>
@@ -760,6 +783,34 @@ def render_html_report(
 ) -> str:
     """Render complete HTML report with interactive review functionality.
 
+    Same arguments as render_html_report_parts(), joined into one string.
+
+    Returns:
+        Complete HTML document as string
+    """
+    return "".join(
+        render_html_report_parts(
+            video_name=video_name,
+            generated_at=generated_at,
+            executive_summary=executive_summary,
+            findings=findings,
+            errors=errors,
+        )
+    )
+
+
+def render_html_report_parts(
+    video_name: str,
+    generated_at: str,
+    executive_summary: str,
+    findings: list[dict[str, Any]],
+    errors: list[dict[str, str]] | None = None,
+) -> list[str]:
+    """Render the HTML report as a list of string pieces, in document order.
+
+    Writing the pieces out one by one (e.g. with ``writelines``) avoids building
+    the whole document, with its embedded screenshots, as one string.
+
     Args:
         video_name: Name of the source video file
         generated_at: ISO timestamp of report generation
@@ -768,41 +819,53 @@ def render_html_report(
         errors: Optional list of pipeline error dictionaries
 
     Returns:
-        Complete HTML document as string
+        HTML document split into pieces; the large blocks are separate items
     """
     errors = errors or []
 
     # Generate unique report ID for localStorage (not cryptographic, just a unique key)
     report_id = hashlib.sha256(f"{video_name}:{generated_at}".encode()).hexdigest()[:12]
 
-    # Format timestamp for display
+    # Format timestamp for display (fromisoformat accepts a "Z" suffix since Python 3.11)
     try:
-        dt = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(generated_at)
         display_time = dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, AttributeError):
+    except (ValueError, TypeError):
         display_time = generated_at
 
+    # Optional executive summary block
+    executive_summary_html = ""
+    if executive_summary:
+        executive_summary_html = (
+            '<div class="executive-summary"><h3>Executive Summary</h3>'
+            f"<p>{html.escape(executive_summary)}</p></div>"
+        )
+
     # Build findings HTML
-    findings_html = "\n".join(_render_finding(f, i + 1) for i, f in enumerate(findings))
+    findings_html = "\n".join([_render_finding(f, i) for i, f in enumerate(findings, 1)])
 
-    # Embed original findings as JSON for export
-    findings_json = json.dumps(findings, ensure_ascii=False)
+    # Embed original findings as JSON for export (escaped for the <script> element)
+    findings_json = prepare_findings_json(findings)
 
-    return f"""<!DOCTYPE html>
+    # Used in the title, the body data attribute and the header
+    video_name_escaped = html.escape(video_name)
+
+    head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Video Review Report - {html.escape(video_name)}</title>
+    <title>Video Review Report - {video_name_escaped}</title>
     <style>
-{CSS_STYLES}
+"""
+    body = f"""
     </style>
 </head>
-<body data-report-id="{report_id}" data-video-name="{html.escape(video_name)}">
+<body data-report-id="{report_id}" data-video-name="{video_name_escaped}">
     <header>
         <h1>Video Review Report</h1>
         <div class="meta">
-            <strong>Video:</strong> {html.escape(video_name)} |
+            <strong>Video:</strong> {video_name_escaped} |
             <strong>Generated:</strong> {html.escape(display_time)}
         </div>
     </header>
@@ -813,11 +876,12 @@ def render_html_report(
 
     {_render_action_items_summary(findings)}
 
-    {f'<div class="executive-summary"><h3>Executive Summary</h3><p>{html.escape(executive_summary)}</p></div>' if executive_summary else ""}
+    {executive_summary_html}
 
     <section class="findings">
         <h2>Findings</h2>
-        {findings_html}
+        """
+    findings_end = """
     </section>
 
     <div id="lightbox" class="lightbox">
@@ -825,7 +889,8 @@ def render_html_report(
     </div>
 
     <script id="original-findings" type="application/json">
-{findings_json}
+"""
+    findings_json_end = """
     </script>
 
     <div class="export-bar">
@@ -842,8 +907,20 @@ def render_html_report(
     </footer>
 
     <script>
-{JS_SCRIPT}
+"""
+    tail = """
     </script>
 </body>
 </html>
 """
+    return [
+        head,
+        CSS_STYLES,
+        body,
+        findings_html,
+        findings_end,
+        findings_json,
+        findings_json_end,
+        JS_SCRIPT,
+        tail,
+    ]
@@ -11,8 +11,8 @@ from rich.panel import Panel
 from rich.table import Table
 
 from .detect import Detection, format_timestamp
-from .html_pro import render_html_report_pro
-from .html_template import render_html_report
+from .html_pro import render_html_report_pro_parts
+from .html_template import render_html_report_parts
 from .image_utils import encode_image_base64
 from .transcribe import Segment
 
@@ -666,7 +666,7 @@ def save_html_report(
     findings_data.sort(key=lambda f: severity_order.get(f.get("severity", "medium"), 4))
 
     # Render HTML using template
-    html_content = render_html_report(
+    html_parts = render_html_report_parts(
         video_name=video_path.name,
         generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
         findings=findings_data,
@@ -674,9 +674,9 @@ def save_html_report(
         errors=errors or [],
     )
 
-    # Write HTML file
+    # Write HTML file piece by piece (no single copy of the whole document)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.writelines(html_parts)
 
     console.print(f"[green]HTML report saved:[/] {output_path}")
     return output_path
@@ -774,7 +774,7 @@ def save_html_report_pro(
 
     # Render HTML using Pro template
     report_video_source = _prepare_html_video_source(video_path, output_path)
-    html_content = render_html_report_pro(
+    html_parts = render_html_report_pro_parts(
         video_name=video_path.name,
         video_path=report_video_source,
         generated_at=datetime.now().isoformat(),
@@ -785,9 +785,9 @@ def save_html_report_pro(
         embed_video=embed_video,
     )
 
-    # Write HTML file
+    # Write HTML file piece by piece (no single copy of the whole document)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.writelines(html_parts)
 
     console.print(f"[green]HTML Pro report saved:[/] {output_path}")
     return output_path
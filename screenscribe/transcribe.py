@@ -16,7 +16,7 @@ DEFAULT_STT_URL = "https://api.libraxis.cloud/v1/audio/transcriptions"
 LOCAL_STT_URL = "http://localhost:7237/transcribe"
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A transcription segment with timing info."""
 
@@ -1,5 +1,10 @@
 """Tests for ScreenScribeConfig environment key handling."""
 
+from pathlib import Path
+
+import pytest
+
+from screenscribe import config as config_module
 from screenscribe.config import ScreenScribeConfig
 
 
@@ -17,6 +22,14 @@ class TestConfigApiBase:
         assert config.llm_endpoint == "https://example.com/v1/responses"
         assert config.vision_endpoint == "https://example.com/v1/responses"
 
+    def test_api_base_suffix_must_end_the_value(self) -> None:
+        """A suffix followed by a trailing newline is not stripped."""
+        config = ScreenScribeConfig()
+
+        config._set_from_key("SCREENSCRIBE_API_BASE", "https://example.com/v1\n")
+
+        assert config.api_base == "https://example.com/v1\n"
+
     def test_api_base_does_not_override_explicit_endpoints(self) -> None:
         """Explicit endpoints remain unchanged when API base is set."""
         config = ScreenScribeConfig()
@@ -29,3 +42,153 @@ class TestConfigApiBase:
         assert config.stt_endpoint == "https://stt.example.com/custom"
         assert config.llm_endpoint == "https://llm.example.com/custom"
         assert config.vision_endpoint == "https://vision.example.com/custom"
+
+
+class TestConfigKeys:
+    """Tests for config key dispatch."""
+
+    def test_provider_keys_fan_out(self) -> None:
+        """Provider keys populate their per-endpoint keys."""
+        config = ScreenScribeConfig()
+
+        config._set_from_key("OPENAI_API_KEY", "sk-openai")
+        config._set_from_key("LIBRAXIS_API_KEY", "lbx-key")
+
+        assert config.llm_api_key == "sk-openai"  # pragma: allowlist secret
+        assert config.vision_api_key == "sk-openai"  # pragma: allowlist secret
+        assert config.stt_api_key == "lbx-key"  # pragma: allowlist secret
+        assert config.api_key == "lbx-key"  # pragma: allowlist secret
+
+    def test_flags_and_endpoints_are_normalized(self) -> None:
+        """Boolean flags are parsed and explicit endpoints lose trailing slashes."""
+        config = ScreenScribeConfig()
+
+        config._set_from_key("SCREENSCRIBE_VISION", "no")
+        config._set_from_key("SCREENSCRIBE_LLM_ENDPOINT", "https://llm.example.com/v1/responses/")
+
+        assert config.use_vision_analysis is False
+        assert config.llm_endpoint == "https://llm.example.com/v1/responses"
+
+    def test_unknown_key_is_ignored(self) -> None:
+        """Keys outside the known set leave the config untouched."""
+        config = ScreenScribeConfig()
+
+        assert config._set_from_key("SOME_OTHER_SETTING", "value") is False
+
+        assert config == ScreenScribeConfig()
+
+
+class TestConfigValidate:
+    """Tests for endpoint validation."""
+
+    def test_defaults_are_valid(self) -> None:
+        """Default LibraxisAI endpoints produce no warnings."""
+        assert ScreenScribeConfig().validate() == []
+
+    def test_validation_reflects_later_endpoint_changes(self) -> None:
+        """Warnings follow the current endpoints, not an earlier result."""
+        config = ScreenScribeConfig()
+        assert config.validate() == []
+
+        config.vision_endpoint = "https://api.libraxis.cloud/v1/chat/completions"
+
+        warnings = config.validate()
+        assert len(warnings) == 1
+        assert "LibraxisAI uses /v1/responses" in warnings[0]
+
+
+class TestConfigFile:
+    """Tests for .env config file parsing."""
+
+    def test_load_from_file_parses_quotes_comments_and_equals(self, tmp_path: Path) -> None:
+        """Comments are skipped, quotes stripped, and '=' kept inside values."""
+        path = tmp_path / "config.env"
+        path.write_text(
+            "# comment\n"
+            "\n"
+            'SCREENSCRIBE_LLM_MODEL="quoted-model"\n'
+            "SCREENSCRIBE_API_KEY=abc=def\n"
+            "not a setting\n",
+            encoding="utf-8",
+        )
+        config = ScreenScribeConfig()
+
+        config._load_from_file(path)
+
+        assert config.llm_model == "quoted-model"
+        assert config.api_key == "abc=def"  # pragma: allowlist secret
+
+    def test_load_from_file_accepts_export_prefix(self, tmp_path: Path) -> None:
+        """Shell-style 'export KEY=value' lines load like plain assignments."""
+        path = tmp_path / "config.env"
+        path.write_text(
+            "export SCREENSCRIBE_API_KEY=sk-test\nexport  SCREENSCRIBE_LANGUAGE=en\n",
+            encoding="utf-8",
+        )
+        config = ScreenScribeConfig()
+
+        config._load_from_file(path)
+
+        assert config.api_key == "sk-test"  # pragma: allowlist secret
+        assert config.language == "en"
+
+    def test_load_from_file_warns_about_unknown_keys(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Unrecognized keys are reported instead of dropped silently."""
+        path = tmp_path / "config.env"
+        path.write_text(
+            "OPENAI_API_BASE=https://api.openai.com\nSCREENSCRIBE_LLM_MODEL=gpt-4o\n",
+            encoding="utf-8",
+        )
+        config = ScreenScribeConfig()
+
+        config._load_from_file(path)
+
+        output = capsys.readouterr().out
+        assert "Unknown config key ignored: OPENAI_API_BASE" in output
+        assert "SCREENSCRIBE_LLM_MODEL" not in output
+        assert config.llm_model == "gpt-4o"
+
+
+class TestConfigLoad:
+    """Tests for ScreenScribeConfig.load()."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point CONFIG_PATHS at a temporary config file with a clean env."""
+        path = tmp_path / "config.env"
+        path.write_text("SCREENSCRIBE_LLM_MODEL=file-model\n")
+        monkeypatch.setattr(config_module, "CONFIG_PATHS", [path])
+        for key in config_module.ENV_MAPPING:
+            monkeypatch.delenv(key, raising=False)
+        return path
+
+    def test_load_reads_file_edits(self, config_file: Path) -> None:
+        """Edits to the config file are picked up by the next load."""
+        assert ScreenScribeConfig.load().llm_model == "file-model"
+
+        config_file.write_text("SCREENSCRIBE_LLM_MODEL=edited-model\n")
+
+        assert ScreenScribeConfig.load().llm_model == "edited-model"
+
+    def test_env_overrides_file(self, config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Environment variables override the config file."""
+        assert ScreenScribeConfig.load().llm_model == "file-model"
+
+        monkeypatch.setenv("SCREENSCRIBE_LLM_MODEL", "env-model")
+
+        assert ScreenScribeConfig.load().llm_model == "env-model"
+
+    def test_load_picks_up_new_higher_priority_file(
+        self, config_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A config file created ahead of the current one takes over."""
+        user_config = tmp_path / "user.env"
+        monkeypatch.setattr(config_module, "CONFIG_PATHS", [user_config, config_file])
+        assert ScreenScribeConfig.load().llm_model == "file-model"
+
+        user_config.write_text("SCREENSCRIBE_LLM_MODEL=user-model\n")
+
+        assert ScreenScribeConfig.load().llm_model == "user-model"
+        assert config_module.find_config_path() == user_config
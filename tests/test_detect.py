@@ -1,5 +1,7 @@
 """Tests for bug and change detection logic."""
 
+from pathlib import Path
+
 import pytest
 
 from screenscribe.detect import (
@@ -10,6 +12,7 @@ from screenscribe.detect import (
     detect_issues,
     format_timestamp,
     merge_consecutive_detections,
+    reset_keywords_config,
 )
 from screenscribe.transcribe import Segment, TranscriptionResult
 
@@ -151,6 +154,105 @@ class TestDetectIssues:
         assert "bug" in categories
         assert "change" in categories
 
+    def test_reports_every_matching_pattern(self) -> None:
+        """Overlapping patterns in one category are all reported."""
+        transcription = TranscriptionResult(
+            text="To nie działa, błąd",
+            segments=[Segment(id=0, start=0.0, end=2.0, text="To nie działa, błąd")],
+            language="pl",
+        )
+        result = detect_issues(transcription)
+        assert len(result) == 1
+        assert {"nie działa", "błąd"} <= set(result[0].keywords_found)
+
+    def test_custom_anchored_and_flagged_patterns(self, tmp_path: Path) -> None:
+        """Anchors and inline flags in custom keywords keep per-segment semantics."""
+        keywords_file = tmp_path / "keywords.yaml"
+        keywords_file.write_text(
+            'bug:\n  - "^crash"\n  - "(?s)zawiesza.*się"\nchange:\n  - "popraw$"\nui: []\n',
+            encoding="utf-8",
+        )
+        transcription = TranscriptionResult(
+            text="",
+            segments=[
+                Segment(id=0, start=0.0, end=2.0, text="Crash przy starcie"),
+                Segment(id=1, start=10.0, end=12.0, text="Potem no crash"),
+                Segment(id=2, start=20.0, end=22.0, text="Popraw"),
+                Segment(id=3, start=30.0, end=32.0, text="Aplikacja zawiesza"),
+                Segment(id=4, start=40.0, end=42.0, text="się potem"),
+            ],
+            language="pl",
+        )
+        try:
+            result = detect_issues(transcription, keywords_file=keywords_file)
+        finally:
+            reset_keywords_config()
+
+        assert [(d.segment.id, d.category) for d in result] == [(0, "bug"), (2, "change")]
+
+    def test_custom_atomic_and_possessive_patterns(self, tmp_path: Path) -> None:
+        """Atomic groups and possessive quantifiers stop at the segment's end."""
+        keywords_file = tmp_path / "keywords.yaml"
+        keywords_file.write_text(
+            'bug:\n  - "crash\\\\s*+$"\nchange:\n  - "(?>popraw\\\\s*)$"\nui: []\n',
+            encoding="utf-8",
+        )
+        transcription = TranscriptionResult(
+            text="",
+            segments=[
+                Segment(id=0, start=0.0, end=2.0, text="app crash "),
+                Segment(id=1, start=10.0, end=12.0, text="ok"),
+                Segment(id=2, start=20.0, end=22.0, text="to popraw "),
+                Segment(id=3, start=30.0, end=32.0, text="ok"),
+            ],
+            language="pl",
+        )
+        try:
+            result = detect_issues(transcription, keywords_file=keywords_file)
+        finally:
+            reset_keywords_config()
+
+        assert [(d.segment.id, d.category) for d in result] == [(0, "bug"), (2, "change")]
+
+    def test_empty_matching_pattern_without_segments(
+        self, empty_transcription: TranscriptionResult, tmp_path: Path
+    ) -> None:
+        """A keyword that matches the empty string finds nothing in no segments."""
+        keywords_file = tmp_path / "keywords.yaml"
+        keywords_file.write_text('bug:\n  - "(?:bug)?"\nchange: []\nui: []\n', encoding="utf-8")
+        try:
+            result = detect_issues(empty_transcription, keywords_file=keywords_file)
+        finally:
+            reset_keywords_config()
+
+        assert result == []
+
+    def test_custom_backreference_patterns(self, tmp_path: Path) -> None:
+        """Backreferences keep their own groups when patterns are combined."""
+        keywords_file = tmp_path / "keywords.yaml"
+        keywords_file.write_text(
+            'bug:\n  - "(a)\\\\1"\n  - "(b)\\\\1"\nchange:\n  - "(c)\\\\1"\nui: []\n',
+            encoding="utf-8",
+        )
+        transcription = TranscriptionResult(
+            text="",
+            segments=[
+                Segment(id=0, start=0.0, end=2.0, text="bb"),
+                Segment(id=1, start=10.0, end=12.0, text="ab"),
+                Segment(id=2, start=20.0, end=22.0, text="cc"),
+            ],
+            language="pl",
+        )
+        try:
+            result = detect_issues(transcription, keywords_file=keywords_file)
+        finally:
+            reset_keywords_config()
+
+        assert [(d.segment.id, d.category, d.keywords_found) for d in result] == [
+            (0, "bug", ["(b)\\1"]),
+            (2, "change", ["(c)\\1"]),
+        ]
+
 
 # --- Test merge_consecutive_detections ---
 
@@ -186,6 +288,16 @@ class TestMergeConsecutiveDetections:
         # All bugs within 5s should be merged into one
         assert len(bug_detections) <= 1
 
+    def test_merge_leaves_transcript_segments_untouched(
+        self, consecutive_bugs_transcription: TranscriptionResult
+    ) -> None:
+        """Merging during detection does not modify the source segments."""
+        detections = detect_issues(consecutive_bugs_transcription)
+
+        assert detections[0].segment.end == 6.0
+        first = consecutive_bugs_transcription.segments[0]
+        assert (first.end, first.text) == (2.0, "To nie działa.")
+
     def test_does_not_merge_different_categories(
         self, mixed_categories_transcription: TranscriptionResult
     ) -> None:
@@ -235,6 +347,25 @@ class TestMergeConsecutiveDetections:
         assert "bug" in result[0].keywords_found
         assert "error" in result[0].keywords_found
 
+    def test_merged_keywords_are_unique_in_first_seen_order(self) -> None:
+        """Merged keywords drop duplicates and keep first-seen order."""
+        detections = [
+            Detection(
+                segment=Segment(id=0, start=0.0, end=1.0, text="Bug"),
+                category="bug",
+                keywords_found=["bug", "broken"],
+                context="context 1",
+            ),
+            Detection(
+                segment=Segment(id=1, start=2.0, end=3.0, text="Error"),
+                category="bug",
+                keywords_found=["error", "bug"],
+                context="context 2",
+            ),
+        ]
+        result = merge_consecutive_detections(detections, max_gap=5.0)
+        assert result[0].keywords_found == ["bug", "broken", "error"]
+
     def test_merged_detection_extends_time_range(self) -> None:
         """Merged detection has start of first and end of last."""
         detections = [
@@ -1,9 +1,14 @@
 """Regression tests for report artifact completeness and review UI wiring."""
 
+import base64
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from screenscribe.detect import Detection
-from screenscribe.html_pro.renderer import render_html_report_pro
+from screenscribe.html_pro.renderer import render_html_report_pro, render_html_report_pro_parts
+from screenscribe.html_template import render_html_report, render_html_report_parts
 from screenscribe.report import (
     save_enhanced_json_report,
     save_enhanced_markdown_report,
@@ -133,3 +138,177 @@ def test_html_pro_report_uses_relative_video_source_without_file_scheme(tmp_path
     assert 'src="sample.mov"' in html
     assert "file://" not in html
     assert (output.parent / "sample.mov").exists()
+
+
+def test_html_pro_report_embedded_json_cannot_close_script() -> None:
+    findings = [{"id": 1, "category": "bug", "text": "Wklejone </script><b>x</b>"}]
+    html = render_html_report_pro(
+        video_name="test.mov",
+        video_path=None,
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=findings,
+        segments=[
+            Segment(id=7, start=0.0, end=1.0, text="Tekst </script> w napisach <!--<script>")
+        ],
+        errors=[],
+    )
+
+    assert "</script><b>" not in html
+    assert "<!--<script>" not in html
+    assert "Wklejone \\u003c/script>\\u003cb>x\\u003c/b>" in html
+    assert (
+        '{"id": 7, "start": 0.0, "end": 1.0, '
+        '"text": "Tekst \\u003c/script> w napisach \\u003c!--\\u003cscript>"}'
+    ) in html
+
+
+def test_html_pro_report_embeds_video_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from screenscribe.html_pro import renderer
+
+    video = tmp_path / "clip.webm"
+    payload = bytes(range(256)) * 3 + b"tail"
+    video.write_bytes(payload)
+    monkeypatch.setattr(renderer, "_VIDEO_EMBED_CHUNK_SIZE", 3 * 7)
+
+    parts = render_html_report_pro_parts(
+        video_name="clip.webm",
+        video_path=str(video),
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=[],
+        embed_video=True,
+    )
+
+    expected = base64.b64encode(payload).decode("ascii")
+    assert f'src="data:video/webm;base64,{expected}"' in "".join(parts)
+    # Each encoded chunk is its own piece, not part of one joined data URL
+    assert base64.b64encode(payload[:21]).decode("ascii") in parts
+
+
+def test_html_pro_report_escapes_unknown_severity_and_timestamp() -> None:
+    findings = [
+        {
+            "id": 1,
+            "category": "bug",
+            "text": "Przycisk nie działa",
+            "timestamp": "12.5",
+            "timestamp_formatted": '00:12" onerror="x',
+            "unified_analysis": {"is_issue": True, "severity": '"><script>x()</script>'},
+        },
+        {
+            "id": 2,
+            "category": "ui",
+            "text": "Za mały kontrast",
+            "timestamp": "00:03",
+            "unified_analysis": {"is_issue": True, "severity": "low"},
+        },
+        {"id": 3, "category": "ui", "timestamp": "nan"},
+        {"id": 4, "category": "ui", "timestamp": float("inf")},
+    ]
+
+    html = render_html_report_pro(
+        video_name="test.mov",
+        video_path=None,
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=findings,
+    )
+
+    assert "<script>x()</script>" not in html
+    assert "severity-&quot;&gt;&lt;script&gt;" in html
+    assert "@ 00:12&quot; onerror=&quot;x</span>" in html
+    assert 'onclick="seekToTimestamp(12.5)"' in html
+    assert '<span class="severity-badge severity-low">low</span>' in html
+    assert "seekToTimestamp(nan)" not in html
+    assert "seekToTimestamp(inf)" not in html
+    assert html.count('onclick="seekToTimestamp(0.0)"') == 3
+
+
+def test_html_pro_report_parts_join_to_rendered_report() -> None:
+    kwargs: dict[str, Any] = {
+        "video_name": "test.mov",
+        "video_path": None,
+        "generated_at": "2026-02-15T17:31:26",
+        "executive_summary": "Podsumowanie",
+        "findings": [{"id": 1, "category": "bug", "text": "Błąd"}],
+        "segments": _sample_segments(),
+    }
+
+    parts = render_html_report_pro_parts(**kwargs)
+
+    assert "".join(parts) == render_html_report_pro(**kwargs)
+    assert "{findings_html}" not in "".join(parts)
+
+
+def test_legacy_html_report_embedded_json_cannot_close_script() -> None:
+    findings = [{"id": 1, "category": "bug", "text": "Wklejone </script><b>x</b> <!--<script>"}]
+
+    html = render_html_report(
+        video_name="test.mov",
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=findings,
+    )
+
+    assert "</script><b>" not in html
+    assert "<!--<script>" not in html
+    assert '"text": "Wklejone \\u003c/script>\\u003cb>x\\u003c/b> \\u003c!--\\u003cscript>"' in html
+
+
+def test_legacy_html_report_escapes_unknown_severity() -> None:
+    findings = [
+        {"id": 1, "unified_analysis": {"severity": '"><script>x()</script>'}},
+        {"id": 2, "unified_analysis": {"severity": "high"}},
+    ]
+
+    html = render_html_report(
+        video_name="test.mov",
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=findings,
+    )
+
+    assert "<script>x()</script>" not in html
+    assert 'class="severity-badge severity-&quot;&gt;&lt;script&gt;' in html
+    assert '<span class="severity-badge severity-high">high</span>' in html
+
+
+def test_legacy_html_report_escapes_finding_id_and_timestamp() -> None:
+    findings = [
+        {
+            "id": 'f1"><b>x</b>',
+            "timestamp_formatted": '00:12" onload="x',
+            "screenshot": "shot.jpg",
+        },
+        {"id": 2, "timestamp_formatted": "00:20"},
+    ]
+
+    html = render_html_report(
+        video_name="test.mov",
+        generated_at="2026-02-15T17:31:26",
+        executive_summary="",
+        findings=findings,
+    )
+
+    assert "<b>x</b>" not in html
+    assert 'data-finding-id="f1&quot;&gt;&lt;b&gt;x&lt;/b&gt;"' in html
+    assert 'alt="Screenshot at 00:12&quot; onload=&quot;x"' in html
+    assert 'data-finding-id="2"' in html
+
+
+def test_legacy_html_report_parts_join_to_rendered_report() -> None:
+    kwargs: dict[str, Any] = {
+        "video_name": "test.mov",
+        "generated_at": "2026-02-15T17:31:26",
+        "executive_summary": "Summary",
+        "findings": [{"id": 1, "category": "bug", "text": "Broken button"}],
+        "errors": [{"stage": "vision", "message": "timeout"}],
+    }
+
+    parts = render_html_report_parts(**kwargs)
+
+    assert "".join(parts) == render_html_report(**kwargs)
+    assert "".join(parts).endswith("</html>\n")